@@ -0,0 +1,160 @@
+"""
+Generates a lexer specialized for the grammar at import time.
+
+The character classes of the grammar are baked into the generated `tokenize`
+function as integer range tests on `ord(c)`, with no transition table, state
+variable or `self.` indirection left to interpret at run time. The generated
+source is cached as `_lexer_gen_<hash>.py` next to this module, keyed by a hash
+of the grammar and of the template, and imported with `importlib`; it is only
+regenerated when the grammar or the template changes.
+"""
+
+import hashlib
+import importlib.util
+import os
+from string import Template
+
+
+# The grammar. Character classes are tuples of inclusive (low, high) code point ranges.
+
+WHITESPACE = ((9, 9), (32, 32))
+DIGIT = ((48, 57),)
+IDENTIFIER_START = ((65, 90), (95, 95), (97, 122))
+IDENTIFIER_PART = DIGIT + IDENTIFIER_START
+OPERATOR = tuple((ord(op), ord(op)) for op in "*+-/<=>")
+SINGLE_CHAR = tuple((ord(sc), ord(sc)) for sc in "(){}")
+
+SINGLE_CHAR_TOKENS = {"{": "LBRACE", "}": "RBRACE", "(": "LPAREN", ")": "RPAREN"}
+KEYWORDS = {"if": "IF", "else": "ELSE", "while": "WHILE"}
+
+GRAMMAR = (WHITESPACE, DIGIT, IDENTIFIER_START, IDENTIFIER_PART, OPERATOR, SINGLE_CHAR, SINGLE_CHAR_TOKENS, KEYWORDS)
+
+CACHE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+TEMPLATE = Template('''\
+# Generated by _gen_lexer.py for grammar $grammar_hash, do not edit.
+
+KEYWORDS = $keywords
+SINGLE_CHAR_TOKENS = $single_char_tokens
+
+
+def tokenize(src, tokens, i, line_number):
+    append = tokens.append
+    n = len(src)
+
+    while i < n:
+        c = ord(src[i])
+
+        if $is_whitespace:
+            i += 1
+
+        elif $is_identifier_start:
+            start = i
+            i += 1
+            while i < n:
+                c = ord(src[i])
+                if $is_identifier_part:
+                    i += 1
+                else:
+                    break
+            value = src[start:i]
+            append((KEYWORDS.get(value, "IDENTIFIER"), value, line_number))
+
+        elif $is_digit:
+            start = i
+            i += 1
+            while i < n:
+                c = ord(src[i])
+                if $is_digit:
+                    i += 1
+                else:
+                    break
+            append(("NUMBER", src[start:i], line_number))
+
+        elif c == 10:
+            line_number += 1
+            i += 1
+
+        elif $is_operator:
+            following = ord(src[i + 1]) if i + 1 < n else -1
+            if c == 47 and following == 47:
+                # "//" comment, the newline ending it is handled on the next iteration
+                i = src.find("\\n", i)
+                if i == -1:
+                    i = n
+            elif following == 61:
+                # Compound operators like <=, >= or ==
+                append(("OPERATOR", src[i:i + 2], line_number))
+                i += 2
+            elif c == 61:
+                append(("ASSIGN", "=", line_number))
+                i += 1
+            else:
+                append(("OPERATOR", src[i], line_number))
+                i += 1
+
+        elif $is_single_char:
+            append((SINGLE_CHAR_TOKENS[src[i]], src[i], line_number))
+            i += 1
+
+        else:
+            raise ValueError(f"Invalid character: {src[i]} at line {line_number}, index {i}")
+
+    return i, line_number
+''')
+
+GRAMMAR_HASH = hashlib.sha256((repr(GRAMMAR) + TEMPLATE.template).encode()).hexdigest()[:16]
+
+
+def _condition(ranges) -> str:
+    return " or ".join(f"c == {low}" if low == high else f"{low} <= c <= {high}" for low, high in ranges)
+
+
+def generate_source() -> str:
+    """
+    Returns the source code of the lexer module specialized for `GRAMMAR`.
+    The module defines `tokenize(src, tokens, i, line_number)`, which appends the
+    tokens of `src` from index `i` to `tokens` and returns the final index and
+    line number.
+    """
+    return TEMPLATE.substitute(
+        grammar_hash=GRAMMAR_HASH,
+        keywords=repr(KEYWORDS),
+        single_char_tokens=repr(SINGLE_CHAR_TOKENS),
+        is_whitespace=_condition(WHITESPACE),
+        is_identifier_start=_condition(IDENTIFIER_START),
+        is_identifier_part=_condition(IDENTIFIER_PART),
+        is_digit=_condition(DIGIT),
+        is_operator=_condition(OPERATOR),
+        is_single_char=_condition(SINGLE_CHAR),
+    )
+
+
+def load():
+    """
+    Returns the generated `tokenize` function.
+    The cached module for the current grammar is imported if it exists, and
+    written first otherwise. If the cache cannot be written, the generated
+    source is executed in memory instead.
+    """
+    module_name = f"_lexer_gen_{GRAMMAR_HASH}"
+    path = os.path.join(CACHE_DIR, module_name + ".py")
+
+    if not os.path.exists(path):
+        source = generate_source()
+        try:
+            # Write to a temporary file first so a concurrent import never sees a partial module
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(source)
+            os.replace(temp_path, path)
+        except OSError:
+            namespace = {}
+            exec(compile(source, path, "exec"), namespace)
+            return namespace["tokenize"]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.tokenize
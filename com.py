@@ -1,4 +1,5 @@
 import json
+import logging
 from lexer import Lexer
 
 
@@ -9,13 +10,15 @@ class Compiler:
         self.ast = None
 
     def lexer(self):
-        lexer = Lexer(self.source_code)
-        lexer.tokenize()
-        self.tokens = lexer.tokens
-        
+        # Tokens are produced lazily, the parser only pulls the ones it needs
+        self.tokens = iter(Lexer(self.source_code))
+
     def parser(self):
         # Parse tokens into an AST
-        self.ast = {"type": "Assignment", "left": self.tokens[0], "right": self.tokens[2]}
+        left = next(self.tokens)
+        next(self.tokens)  # "="
+        right = next(self.tokens)
+        self.ast = {"type": "Assignment", "left": left, "right": right}
 
     def semantic_analysis(self):
         # Check semantics (e.g., variable declaration)
@@ -34,15 +37,18 @@ class Compiler:
 
 
 # Example usage
-source = """
-x = 5 + 3
-// This is a comment
-if x > 5 {
-    y = x - 2
-} else {
-    y = 0
-}
-"""
-compiler = Compiler(source)
-compiler.lexer()
-print(json.dumps(compiler.tokens, indent=4))
\ No newline at end of file
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    source = """
+    x = 5 + 3
+    // This is a comment
+    if x > 5 {
+        y = x - 2
+    } else {
+        y = 0
+    }
+    """
+    compiler = Compiler(source)
+    compiler.lexer()
+    print(json.dumps(list(compiler.tokens), indent=4))
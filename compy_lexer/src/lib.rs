@@ -0,0 +1,140 @@
+//! Native lexer for compy.
+//!
+//! Scans the source as bytes with a 256-entry byte-class table, skips comments
+//! with `memchr` and returns the same `(type, value, line)` tokens as the
+//! Python lexers.
+
+use memchr::memchr;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+const UNKNOWN: u8 = 0;
+const DIGIT: u8 = 1;
+const ALPHA: u8 = 2;
+const WHITESPACE: u8 = 3;
+const NEWLINE: u8 = 4;
+const OPERATOR: u8 = 5;
+const SINGLE_CHAR: u8 = 6;
+
+static CLASS: [u8; 256] = build_classes();
+
+const fn build_classes() -> [u8; 256] {
+    let mut classes = [UNKNOWN; 256];
+    let mut b = 0;
+    while b < 256 {
+        classes[b] = match b as u8 {
+            b'0'..=b'9' => DIGIT,
+            b'a'..=b'z' | b'A'..=b'Z' | b'_' => ALPHA,
+            b' ' | b'\t' => WHITESPACE,
+            b'\n' => NEWLINE,
+            b'+' | b'-' | b'*' | b'/' | b'<' | b'>' | b'=' => OPERATOR,
+            b'{' | b'}' | b'(' | b')' => SINGLE_CHAR,
+            _ => UNKNOWN,
+        };
+        b += 1;
+    }
+    classes
+}
+
+fn keyword(value: &str) -> &'static str {
+    match value {
+        "if" => "IF",
+        "else" => "ELSE",
+        "while" => "WHILE",
+        _ => "IDENTIFIER",
+    }
+}
+
+fn single_char(b: u8) -> &'static str {
+    match b {
+        b'{' => "LBRACE",
+        b'}' => "RBRACE",
+        b'(' => "LPAREN",
+        _ => "RPAREN",
+    }
+}
+
+/// Tokenize `source` into `(type, value, line)` tuples.
+///
+/// Leading whitespace is skipped without counting its newlines, so the first
+/// token is on line 1, as with the Python lexers.
+#[pyfunction]
+fn tokenize(source: &str) -> PyResult<Vec<(&'static str, String, u32)>> {
+    let bytes = source.as_bytes();
+    let n = bytes.len();
+    let mut tokens = Vec::with_capacity(n / 4);
+    let mut line_number: u32 = 1;
+    let mut i = n - source.trim_start().len();
+
+    // SAFETY: tokens only ever span ASCII bytes, which are always on a char boundary.
+    let slice = |start: usize, end: usize| unsafe { source.get_unchecked(start..end) }.to_owned();
+
+    while i < n {
+        let b = bytes[i];
+        match CLASS[b as usize] {
+            WHITESPACE => {
+                i += 1;
+                while i < n && CLASS[bytes[i] as usize] == WHITESPACE {
+                    i += 1;
+                }
+            }
+            ALPHA => {
+                let start = i;
+                i += 1;
+                while i < n && matches!(CLASS[bytes[i] as usize], ALPHA | DIGIT) {
+                    i += 1;
+                }
+                let value = slice(start, i);
+                tokens.push((keyword(&value), value, line_number));
+            }
+            DIGIT => {
+                let start = i;
+                i += 1;
+                while i < n && CLASS[bytes[i] as usize] == DIGIT {
+                    i += 1;
+                }
+                tokens.push(("NUMBER", slice(start, i), line_number));
+            }
+            NEWLINE => {
+                line_number += 1;
+                i += 1;
+            }
+            OPERATOR => {
+                let following = if i + 1 < n { bytes[i + 1] } else { 0 };
+                if b == b'/' && following == b'/' {
+                    // The newline ending the comment is handled on the next iteration
+                    i = memchr(b'\n', &bytes[i..]).map_or(n, |offset| i + offset);
+                } else if following == b'=' {
+                    // Compound operators like <=, >= or ==
+                    tokens.push(("OPERATOR", slice(i, i + 2), line_number));
+                    i += 2;
+                } else if b == b'=' {
+                    tokens.push(("ASSIGN", slice(i, i + 1), line_number));
+                    i += 1;
+                } else {
+                    tokens.push(("OPERATOR", slice(i, i + 1), line_number));
+                    i += 1;
+                }
+            }
+            SINGLE_CHAR => {
+                tokens.push((single_char(b), slice(i, i + 1), line_number));
+                i += 1;
+            }
+            _ => {
+                let index = source[..i].chars().count();
+                let char = source[i..].chars().next().unwrap_or_default();
+                return Err(PyValueError::new_err(format!(
+                    "Invalid character: {char} at line {line_number}, index {index}"
+                )));
+            }
+        }
+    }
+
+    Ok(tokens)
+}
+
+#[pymodule]
+fn compy_lexer(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(tokenize, m)?)?;
+    Ok(())
+}
@@ -1,4 +1,6 @@
+import functools
 import logging
+import re
 
 """
 Lexer Module
@@ -28,6 +30,11 @@ Example:
     lexer.tokenize()
     print(lexer.tokens)
     ```
+Alternatively, iterate over the `Lexer` to pull tokens lazily, one at a time, without storing them:
+    ```python
+    for token_type, token_value, line_number in Lexer(source_code):
+        ...
+    ```
 Classes
 -------
 - `Lexer`: The main class for tokenizing source code.
@@ -35,277 +42,296 @@ Classes
 Methods
 -------
 - `__init__(source_code: str)`: Initializes the lexer with the source code.
-- `tokenize()`: Tokenizes the source code into a sequence of tokens.
-- `_handle_start_state(next_char: str)`: Handles the START state of the lexer.
-- `_handle_in_number_state(next_char: str)`: Handles the IN_NUMBER state of the lexer.
-- `_handle_in_identifier_state(next_char: str)`: Handles the IN_IDENTIFIER state of the lexer.
-- `_handle_in_operator_state(next_char: str)`: Handles the IN_OPERATOR state of the lexer.
-- `_handle_in_comment_state(next_char: str)`: Handles the IN_COMMENT state of the lexer.
-- `_append_token_then_transists_start(token_type: str, token_value: str)`: Appends a token and transitions to the START state.
+- `__iter__()`: Yields the tokens of the source code one at a time as they are recognized.
+- `tokenize()`: Tokenizes the source code into a sequence of tokens stored on the lexer.
+- `_handle_start_state(next_char: str, index: int)`: Handles the START state of the lexer, including whole
+  numbers, identifiers and operators.
+- `_handle_in_comment_state(next_char: str, index: int)`: Handles the IN_COMMENT state of the lexer.
 
 Attributes
 ----------
 - `source_code (str)`: The source code to tokenize.
-- `tokens (list)`: The list of tokens generated.
-- `current_token (str)`: The token currently being processed.
+- `tokens (list)`: The list of tokens generated, as (type, value, line number) tuples. Built on access from
+  `token_types`, `token_values` and `token_lines`, which hold the token fields as parallel lists.
+- `token_start (int)`: The index in the source code where the token currently being processed starts.
 - `line_number (int)`: The current line number in the source code.
 - `index (int)`: The current index in the source code being processed.
 - `state (str)`: The current DFA state.
 
 Exceptions
 ----------
-- Logs an error and stops tokenization if an exception occurs during processing. 
+- `tokenize()` logs an error and stops tokenization if an exception occurs during processing; iterating over the
+  lexer raises the exception to the caller instead.
 """
 
 logger = logging.getLogger(__name__)
 
+# Sources up to this length are tokenized through `_tokenize_cached`; longer ones would pin
+# too much memory in the cache and are unlikely to be tokenized twice.
+_CACHE_MAX_SOURCE_LENGTH = 64 * 1024
+
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+_NUMBER_RE = re.compile(r"\d+")
+_IDENTIFIER_RE = re.compile(r"\w+")
+
+KEYWORDS = {"if": "IF", "else": "ELSE", "while": "WHILE"}
+
+SINGLE_CHAR_TOKENS = {"{": "LBRACE", "}": "RBRACE", "(": "LPAREN", ")": "RPAREN"}
+
+# Character classes used by the START state. `_CHAR_CLASSES` maps every Latin-1 code point to its
+# class so the START state classifies a character with a single `bytes` subscription instead of
+# a series of `isdigit`/`isalpha`/`in` tests.
+_UNKNOWN, _DIGIT, _ALPHA, _WHITESPACE, _NEWLINE, _OPERATOR, _SINGLE_CHAR = range(7)
+
+
+def _classify(char: str) -> int:
+    if char.isdecimal():
+        return _DIGIT
+    elif char.isalpha() or char == "_":
+        return _ALPHA
+    elif char in "+-*/<>=":
+        return _OPERATOR
+    elif char in " \t":
+        return _WHITESPACE
+    elif char == "\n":
+        return _NEWLINE
+    elif char in SINGLE_CHAR_TOKENS:
+        return _SINGLE_CHAR
+    return _UNKNOWN
+
+
+_CHAR_CLASSES = bytes(_classify(chr(code)) for code in range(256))
+
 class Lexer():
         
     def __init__(self, source_code: str):
-        logging.basicConfig(level=logging.INFO)
-        self.source_code = source_code.lstrip()
-        self.tokens = []    
+        self.source_code = source_code
+        self.token_types = []
+        self.token_values = []
+        self.token_lines = []
         
-        self.current_token = ""
+        self.token_start = 0
         self.line_number = 1
-        self.index = 0 
+        # Start after any leading whitespace instead of storing a stripped copy of the source
+        self.index = _LEADING_WHITESPACE_RE.match(source_code).end()
+
+    @property
+    def tokens(self):
+        """
+        The tokens generated so far, as a list of (type, value, line number) tuples.
+        The tuples are only assembled here; the lexer itself appends each field to its own list.
+        """
+        return list(zip(self.token_types, self.token_values, self.token_lines))
 
     def tokenize(self):
         """
-        Tokenizes the source code into a sequence of tokens using a deterministic finite automaton (DFA).
+        Tokenizes the source code and stores the tokens on the lexer.
+
+        The tokens are pulled from `__iter__` and their fields appended to `token_types`,
+        `token_values` and `token_lines`. Sources up to `_CACHE_MAX_SOURCE_LENGTH` characters
+        are tokenized through `_tokenize_cached`, so tokenizing the same source again only
+        copies the cached tokens.
+
+        Exceptions:
+            Logs an error and stops tokenization if an exception occurs during processing.
+            The error log includes the index, line number, token start, state, tokens, and the next character.
+
+        Returns:
+            None
+        """
+        if len(self.source_code) <= _CACHE_MAX_SOURCE_LENGTH:
+            try:
+                tokens, index, line_number, state = _tokenize_cached(self.source_code, self.index, self.line_number)
+            except Exception:
+                # Errors are not cached: tokenize again below to keep the partial tokens and log the error
+                pass
+            else:
+                if tokens:
+                    token_types, token_values, token_lines = zip(*tokens)
+                    self.token_types.extend(token_types)
+                    self.token_values.extend(token_values)
+                    self.token_lines.extend(token_lines)
+                self.index, self.line_number, self.state = index, line_number, state
+                return
+
+        append_type = self.token_types.append
+        append_value = self.token_values.append
+        append_line = self.token_lines.append
+
+        try:
+            for token_type, token_value, token_line in self:
+                append_type(token_type)
+                append_value(token_value)
+                append_line(token_line)
+        except Exception as e:
+            logger.error("%r", e)
+            logger.error("Error at index %s, line %s, token_start: %s, state: %s, tokens: %s, next_char: %s",
+                         self.index, self.line_number, self.token_start, self.state, self.tokens,
+                         self.source_code[self.index:self.index + 1])
+
+    def __iter__(self):
+        """
+        Yields the tokens of the source code using a deterministic finite automaton (DFA).
 
         The method processes the source code character by character, transitioning between states
         based on the current character and the current DFA state. It handles different types of tokens
-        such as numbers, identifiers, operators, and comments.
+        such as numbers, identifiers, operators, and comments. Tokens are not built up character by
+        character: only their start index is recorded, and the token value is sliced out of the
+        source code once when the token is emitted. Numbers and identifiers are consumed whole by a
+        single precompiled regex match from the START state.
+        Each handler returns how many characters it consumed, and the main loop is the only place
+        that moves the index. The comment handler stops before the newline ending the comment and
+        leaves it to the START state, which is the only place newlines are counted.
 
         States:
-            - START: Initial state, determines the type of token to process.
-            - IN_NUMBER: State for processing numeric tokens.
-            - IN_IDENTIFIER: State for processing identifier tokens.
-            - IN_OPERATOR: State for processing operator tokens.
+            - START: Initial state, determines the type of token to process and emits numbers,
+              identifiers, operators and single-character tokens.
             - IN_COMMENT: State for processing comment tokens.
 
         Attributes:
             self.source_code (str): The source code to tokenize.
             self.index (int): The current index in the source code being processed.
             self.state (str): The current DFA state.
-            self.current_token (str): The token currently being processed.
-            self.tokens (list): The list of tokens generated so far.
+            self.token_start (int): The index where the token currently being processed starts.
             self.line_number (int): The current line number in the source code.
 
-        Exceptions:
-            Logs an error and stops tokenization if an exception occurs during processing.
-            The error log includes the index, line number, current token, state, tokens, and the next character.
+        Yields:
+            tuple: A (token type, token value, line number) tuple for each token, as soon as it is recognized.
 
-        Returns:
-            None
+        Raises:
+            ValueError: If an unexpected character is encountered.
         """
         # DFA states
         START = "START"
-        IN_NUMBER = "IN_NUMBER"
-        IN_IDENTIFIER = "IN_IDENTIFIER"
-        IN_OPERATOR = "IN_OPERATOR"
         IN_COMMENT = "IN_COMMENT"
 
-        self.state = START
-        try:
-            while self.index < len(self.source_code):
-                next_char = self.source_code[self.index]
-
-                if self.state == START:
-                    self.state, self.current_token = self._handle_start_state(next_char)
+        # Bind the per-character attributes and methods to locals; they are written back once
+        # the loop stops or the generator is closed
+        source_code = self.source_code
+        source_length = len(source_code)
+        index = self.index
+        state = START
+        handle_start_state = self._handle_start_state
+        handle_in_comment_state = self._handle_in_comment_state
+        self.state = state
 
-                elif self.state == IN_NUMBER:
-                    self.state, self.current_token = self._handle_in_number_state(next_char)
-
-                elif self.state == IN_IDENTIFIER:
-                    self.state, self.current_token = self._handle_in_identifier_state(next_char)
+        try:
+            while index < source_length:
+                next_char = source_code[index]
 
-                elif self.state == IN_OPERATOR:
-                    self.state, self.current_token = self._handle_in_operator_state(next_char)
+                if state == START:
+                    state, token, advance = handle_start_state(next_char, index)
 
-                elif self.state == IN_COMMENT:
-                    self.state, self.current_token = self._handle_in_comment_state(next_char)
+                elif state == IN_COMMENT:
+                    state, token, advance = handle_in_comment_state(next_char, index)
 
-                self.index += 1  # Move to the next character
-        except Exception as e:
-            logger.error(repr(e))
-            logger.error(f"Error at index {self.index}, line {self.line_number}, token: {self.current_token}, state: {self.state}, tokens: {self.tokens}, next_char: {next_char}")
-            return
+                index += advance
+                if token is not None:
+                    yield token
+        finally:
+            self.index, self.state = index, state
 
     
-    def _handle_start_state(self, next_char: str):
+    def _handle_start_state(self, next_char: str, index: int):
         """
         Handles the START state of the lexer by processing the next character and determining the 
         appropriate state transition and token generation.
         Args:
             next_char (str): The next character to process.
+            index (int): The index of `next_char` in the source code.
         Returns:
-            tuple: A tuple containing the next state (str) and the updated current token (str).
+            tuple: A tuple containing the next state (str), the emitted token (tuple), or None if
+                   no token was emitted, and the number of characters consumed (int).
         Raises:
             ValueError: If an unexpected character is encountered.
         Behavior:
-            - Transitions to "IN_NUMBER" state if the character is a digit.
-            - Transitions to "IN_IDENTIFIER" state if the character is an alphabetic character or an underscore.
-            - Transitions to "IN_OPERATOR" state if the character is an operator (+, -, *, /, <, >, =).
-            - Remains in "START" state if the character is a space or tab.
+            - Emits a "NUMBER" token for the whole run of digits if the character is a digit.
+            - Emits an "IDENTIFIER" token, or a keyword token if it is in `KEYWORDS`, for the whole run of
+              alphanumeric characters and underscores if the character is an alphabetic character or an
+              underscore.
+            - Transitions to "IN_COMMENT" state if the character and the one after it are "//".
+            - Emits a two-character "OPERATOR" token if the character is an operator (+, -, *, /, <, >, =)
+              followed by "=", and a one-character "OPERATOR" token, or "ASSIGN" for "=", otherwise.
+            - Remains in "START" state if the character is a space or tab, skipping the whole
+              run of spaces and tabs at once.
             - Increments the line number and remains in "START" state if the character is a newline.
-            - Emits a single-character token and transitions to "START" state for specific characters 
-              ({, }, (, ), =).
+            - Emits a single-character token and transitions to "START" state for specific characters
+              ({, }, (, )).
             - Raises a ValueError for any unexpected character.
+        The character is classified with one lookup in `_CHAR_CLASSES`; characters outside Latin-1
+        fall back to `_classify`.
         """
 
-        logger.debug(f"in START state handling next_char: {next_char}")
-        if next_char.isdigit():
-            return "IN_NUMBER", self.current_token + next_char
-        elif next_char.isalpha() or next_char == "_":
-            return "IN_IDENTIFIER", self.current_token + next_char
-        elif next_char in "+-*/<>=":
-            return "IN_OPERATOR", self.current_token + next_char 
-        elif next_char in " \t":
-            return "START", ""
-        elif next_char == "\n":
+        code = ord(next_char)
+        char_class = _CHAR_CLASSES[code] if code < 256 else _classify(next_char)
+
+        # Branches are ordered by how often each class occurs in typical source code
+        if char_class == _WHITESPACE:
+            # Skip the whole whitespace run
+            end = _WHITESPACE_RE.match(self.source_code, index).end()
+            return "START", None, end - index
+        elif char_class == _ALPHA:
+            # Consume the whole identifier
+            self.token_start = index
+            end = _IDENTIFIER_RE.match(self.source_code, index).end()
+            token_value = self.source_code[index:end]
+            return "START", (KEYWORDS.get(token_value, "IDENTIFIER"), token_value, self.line_number), end - index
+        elif char_class == _DIGIT:
+            # Consume the whole number
+            self.token_start = index
+            end = _NUMBER_RE.match(self.source_code, index).end()
+            return "START", ("NUMBER", self.source_code[index:end], self.line_number), end - index
+        elif char_class == _OPERATOR:
+            # Peek at the following character instead of entering a state of its own
+            self.token_start = index
+            following = self.source_code[index + 1:index + 2]
+            if next_char == "/" and following == "/":
+                return "IN_COMMENT", None, 2
+            elif following == "=":
+                # Compound operators like <=, >= or ==
+                return "START", ("OPERATOR", next_char + following, self.line_number), 2
+            return "START", ("ASSIGN" if next_char == "=" else "OPERATOR", next_char, self.line_number), 1
+        elif char_class == _NEWLINE:
             self.line_number += 1
-            return "START", ""
-        elif next_char in "{}()=":
-            token_map = {
-                '{': 'LBRACE',
-                '}': 'RBRACE',
-                '(': 'LPAREN',
-                ')': 'RPAREN',
-                '=': 'ASSIGN'
-            }
+            return "START", None, 1
+        elif char_class == _SINGLE_CHAR:
             # Emit single-character tokens
-            return self._append_token_then_transists_start(token_type=token_map[next_char], token_value=next_char)
+            return "START", (SINGLE_CHAR_TOKENS[next_char], next_char, self.line_number), 1
         else:
             raise ValueError(f"Unexpected character '{next_char}' at line {self.line_number}")
     
-    def _handle_in_number_state(self, next_char: str):
-        """
-        Handles the lexer state when parsing a numeric token.
-        This method processes the next character while the lexer is in the "IN_NUMBER" state.
-        If the character is a digit, it appends it to the current token and remains in the
-        "IN_NUMBER" state. If the character is not a digit, it finalizes the current numeric
-        token, transitions to the "START" state, and processes the character accordingly.
-        Args:
-            next_char (str): The next character to process.
-        Returns:
-            tuple: A tuple containing the next state (str) and the updated token (str or None).
-        """
-
-        logger.debug(f"in NUMBER state handling next_char: {next_char}, current_token: {self.current_token}, line_number: {self.line_number}, index: {self.index}")
-        if next_char.isdigit():
-            return "IN_NUMBER", self.current_token + next_char
-        # Emit number token
-        state, token =  self._append_token_then_transists_start(token_type="NUMBER", token_value=self.current_token)
-        
-        if next_char == "\n":
-            self.line_number += 1
-        
-        return state, token
-
-    def _handle_in_identifier_state(self, next_char: str):
-        """
-        Handles the lexer state when processing an identifier.
-        This method determines the next state and token based on the current 
-        character (`next_char`) and the current token being built. It processes 
-        alphanumeric characters and underscores as part of an identifier, and 
-        emits tokens for identifiers or keywords when appropriate.
-        Args:
-            next_char (str): The next character to process in the input stream.
-        Returns:
-            tuple: A tuple containing:
-                - state (str): The next state of the lexer.
-                - token (str): The updated token or the emitted token value.
-        Behavior:
-            - If `next_char` is alphanumeric or an underscore, it appends it to 
-              the current token and remains in the "IN_IDENTIFIER" state.
-            - If the current token matches a keyword (e.g., "if", "else", "while"), 
-              it emits a keyword token and transitions to the start state.
-            - Otherwise, it emits an identifier token and transitions to the start state.
-            - If `next_char` is a newline character, it increments the line number.
-        """
-
-        logger.debug(f"in IDENTIFIER state handling next_char: {next_char}, current_token: {self.current_token}, line_number: {self.line_number}, index: {self.index}")
-        if next_char.isalnum() or next_char == "_":
-            state, token =  "IN_IDENTIFIER", self.current_token + next_char
-        # Emit identifier or keyword token
-        elif self.current_token in {"if", "else", "while"}:
-            state, token =  self._append_token_then_transists_start(token_type=self.current_token.upper(), token_value=self.current_token)
-        else:
-            state, token =  self._append_token_then_transists_start(token_type="IDENTIFIER", token_value=self.current_token)
-        
-        if next_char == "\n":
-            self.line_number += 1
-        
-        return state, token
-
-    def _handle_in_operator_state(self, next_char: str):
-        """
-        Handles the lexer state when processing an operator token.
-        This method is responsible for determining the next state and token
-        when the lexer is in the "OPERATOR" state and encounters the next character.
-        It handles cases such as single-character operators, compound operators,
-        and transitions to comments.
-        Args:
-            next_char (str): The next character to process.
-        Returns:
-            tuple: A tuple containing:
-                - state (str): The next state of the lexer.
-                - token (str): The token generated during this transition.
-        Behavior:
-            - If the current token is "/" and the next character is "/", the lexer
-              transitions to the "IN_COMMENT" state.
-            - If the current token is "=" and the next character is not "=", the lexer
-              generates an "ASSIGN" token and transitions to the start state.
-            - If the next character is "=", it appends "=" to the current token to form
-              a compound operator and generates an "OPERATOR" token.
-            - If the next character is a newline ("\n"), the line number is incremented.
-        """
-
-        logger.debug(f"in OPERATOR state handling next_char: {next_char}, current_token: {self.current_token}, line_number: {self.line_number}, index: {self.index}")
-        # Check if it's the start of a comment
-        if self.current_token == "/" and next_char == "/":
-            state, token = "IN_COMMENT", ""
-
-        elif self.current_token == "=" and next_char != "=":
-            state, token = self._append_token_then_transists_start(token_type="ASSIGN", token_value=self.current_token)
-
-        else:
-            # Check for compound operators like <=, >= or ==
-            if next_char == "=":
-                self.current_token += next_char
-                self.index += 1  # Skip the second character
-            state, token =  self._append_token_then_transists_start(token_type="OPERATOR", token_value=self.current_token)
-        
-        if next_char == "\n":
-            self.line_number += 1
-
-        return state, token
-        
-    def _handle_in_comment_state(self, next_char: str):
+    def _handle_in_comment_state(self, next_char: str, index: int):
         """
         Handles the lexer state when inside a comment.
         This method processes characters while the lexer is in the COMMENT state.
-        It skips over all characters until a newline is encountered, effectively
-        ignoring the content of the comment. The method also updates the line
-        number and index to reflect the position after the comment.
+        It jumps straight to the next newline with `str.find`, effectively
+        ignoring the content of the comment. The newline ending the comment is
+        not consumed and is counted by the START state.
         Args:
             next_char (str): The next character to process.
+            index (int): The index of `next_char` in the source code.
         Returns:
-            tuple: A tuple containing the next state ("START") and an empty string,
-                   indicating the end of the comment handling.
+            tuple: A tuple containing the next state ("START"), indicating the end of the comment
+                   handling, None, as comments emit no token, and the number of characters
+                   consumed (int).
         """
 
-        logger.debug(f"in COMMENT state handling next_char: {next_char}, current_token: {self.current_token}, line_number: {self.line_number}, index: {self.index}")
-        if next_char == "\n":
-            self.line_number += 1
-        while self.index < len(self.source_code) and self.source_code[self.index] != "\n":
-            self.index += 1
-        self.line_number += 1
-        return "START", ""
-
-    def _append_token_then_transists_start(self, token_type: str, token_value: str):
-        self.tokens.append((token_type, token_value, self.line_number))
-        return "START", ""
-    
\ No newline at end of file
+        comment_end = self.source_code.find("\n", index)
+        if comment_end == -1:
+            comment_end = len(self.source_code)
+        return "START", None, comment_end - index
+    
+
+
+@functools.lru_cache(maxsize=128)
+def _tokenize_cached(source_code: str, index: int, line_number: int):
+    """
+    Tokenizes `source_code` from `index` and `line_number` and caches the result.
+    Returns:
+        tuple: The tokens (tuple of token tuples), and the index, line number and state the lexer ends in.
+    """
+    lexer = Lexer(source_code)
+    lexer.index, lexer.line_number = index, line_number
+    tokens = tuple(lexer)
+    return tokens, lexer.index, lexer.line_number, lexer.state
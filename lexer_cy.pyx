@@ -0,0 +1,225 @@
+# cython: language_level=3
+"""
+Cython port of the handler-based DFA in `lexer.py`.
+
+The five `_handle_*` methods are inlined into a single `while` loop over the
+source string with C-typed locals, so each character costs a C switch
+instead of a Python method call. Emitted tokens are recorded as (kind,
+start, end, line) in a C struct-of-arrays buffer and only turned into
+Python tuples once the scan is done.
+
+Build it in place with:
+    cythonize -i lexer_cy.pyx
+"""
+
+cimport cython
+from libc.stdlib cimport free, realloc
+
+
+cdef enum State:
+    START
+    IN_NUMBER
+    IN_IDENTIFIER
+    IN_OPERATOR
+    IN_COMMENT
+
+cdef enum Kind:
+    NUMBER
+    IDENTIFIER
+    OPERATOR
+    ASSIGN
+    LBRACE
+    RBRACE
+    LPAREN
+    RPAREN
+
+KIND_NAMES = ("NUMBER", "IDENTIFIER", "OPERATOR", "ASSIGN", "LBRACE", "RBRACE", "LPAREN", "RPAREN")
+
+KEYWORDS = {"if": "IF", "else": "ELSE", "while": "WHILE"}
+
+
+cdef struct TokenBuffer:
+    Py_ssize_t count
+    Py_ssize_t capacity
+    int *kinds
+    Py_ssize_t *starts
+    Py_ssize_t *ends
+    int *lines
+
+
+cdef int _grow(TokenBuffer *buf) except -1:
+    cdef Py_ssize_t capacity = buf.capacity * 2 if buf.capacity else 64
+    cdef void *p
+
+    p = realloc(buf.kinds, capacity * sizeof(int))
+    if p == NULL:
+        raise MemoryError()
+    buf.kinds = <int *>p
+    p = realloc(buf.starts, capacity * sizeof(Py_ssize_t))
+    if p == NULL:
+        raise MemoryError()
+    buf.starts = <Py_ssize_t *>p
+    p = realloc(buf.ends, capacity * sizeof(Py_ssize_t))
+    if p == NULL:
+        raise MemoryError()
+    buf.ends = <Py_ssize_t *>p
+    p = realloc(buf.lines, capacity * sizeof(int))
+    if p == NULL:
+        raise MemoryError()
+    buf.lines = <int *>p
+    buf.capacity = capacity
+    return 0
+
+
+cdef inline int _push(TokenBuffer *buf, int kind, Py_ssize_t start, Py_ssize_t end, int line) except -1:
+    if buf.count == buf.capacity:
+        _grow(buf)
+    buf.kinds[buf.count] = kind
+    buf.starts[buf.count] = start
+    buf.ends[buf.count] = end
+    buf.lines[buf.count] = line
+    buf.count += 1
+    return 0
+
+
+class Lexer:
+    """
+    A simple lexer for tokenizing source code, compiled with Cython.
+    It recognizes the same token types as `lexer.Lexer`.
+    Attributes:
+        source_code (str): The input source code to be tokenized.
+        tokens (list): A list of tokens generated by the lexer, where each token
+            is a tuple containing the token type, token value, and line number.
+        line_number (int): The current line number being processed.
+        index (int): The current position in the source code being processed.
+    Raises:
+        ValueError: If an invalid character is encountered during tokenization.
+    """
+
+    def __init__(self, str source_code):
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t n = len(source_code)
+
+        # Start after any leading whitespace instead of storing a stripped copy of the source
+        while i < n and source_code[i].isspace():
+            i += 1
+
+        self.source_code = source_code
+        self.tokens = []
+        self.line_number = 1
+        self.index = i
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def tokenize(self):
+        """
+        Tokenize the source code with the inlined DFA and convert the token
+        buffer into `self.tokens` once the scan stops.
+        """
+        cdef str src = self.source_code
+        cdef Py_ssize_t n = len(src)
+        cdef Py_ssize_t i = self.index
+        cdef Py_ssize_t start = i
+        cdef Py_ssize_t k
+        cdef int line_number = self.line_number
+        cdef int state = START
+        cdef Py_UCS4 c = 0
+        cdef bint failed = False
+        cdef TokenBuffer buf
+        buf.count = buf.capacity = 0
+        buf.kinds = buf.lines = NULL
+        buf.starts = buf.ends = NULL
+
+        try:
+            while i < n:
+                c = src[i]
+
+                if state == START:
+                    if c.isdigit():
+                        state = IN_NUMBER
+                        start = i
+                    elif c.isalpha() or c == u"_":
+                        state = IN_IDENTIFIER
+                        start = i
+                    elif c in u"+-*/<>=":
+                        state = IN_OPERATOR
+                        start = i
+                    elif c == u" " or c == u"\t":
+                        pass
+                    elif c == u"\n":
+                        line_number += 1
+                    elif c == u"{":
+                        _push(&buf, LBRACE, i, i + 1, line_number)
+                    elif c == u"}":
+                        _push(&buf, RBRACE, i, i + 1, line_number)
+                    elif c == u"(":
+                        _push(&buf, LPAREN, i, i + 1, line_number)
+                    elif c == u")":
+                        _push(&buf, RPAREN, i, i + 1, line_number)
+                    else:
+                        failed = True
+                        break
+                    i += 1
+
+                elif state == IN_NUMBER:
+                    if c.isdigit():
+                        i += 1
+                    else:
+                        # Emit, then reprocess the current character in START
+                        _push(&buf, NUMBER, start, i, line_number)
+                        state = START
+
+                elif state == IN_IDENTIFIER:
+                    if c.isalnum() or c == u"_":
+                        i += 1
+                    else:
+                        _push(&buf, IDENTIFIER, start, i, line_number)
+                        state = START
+
+                elif state == IN_OPERATOR:
+                    if src[start] == u"/" and c == u"/":
+                        state = IN_COMMENT
+                        i += 1
+                    elif c == u"=":
+                        # Compound operators like <=, >= or ==
+                        _push(&buf, OPERATOR, start, i + 1, line_number)
+                        state = START
+                        i += 1
+                    else:
+                        _push(&buf, ASSIGN if src[start] == u"=" else OPERATOR, start, i, line_number)
+                        state = START
+
+                else:
+                    # IN_COMMENT: the newline ending the comment is handled in START
+                    i = src.find(u"\n", i)
+                    if i == -1:
+                        i = n
+                    state = START
+
+            if not failed:
+                if state == IN_NUMBER:
+                    _push(&buf, NUMBER, start, i, line_number)
+                elif state == IN_IDENTIFIER:
+                    _push(&buf, IDENTIFIER, start, i, line_number)
+                elif state == IN_OPERATOR:
+                    _push(&buf, ASSIGN if src[start] == u"=" else OPERATOR, start, i, line_number)
+
+            tokens_append = self.tokens.append
+            for k in range(buf.count):
+                value = src[buf.starts[k]:buf.ends[k]]
+                if buf.kinds[k] == IDENTIFIER:
+                    tokens_append((KEYWORDS.get(value, "IDENTIFIER"), value, buf.lines[k]))
+                else:
+                    tokens_append((KIND_NAMES[buf.kinds[k]], value, buf.lines[k]))
+        finally:
+            free(buf.kinds)
+            free(buf.starts)
+            free(buf.ends)
+            free(buf.lines)
+
+        self.index = i
+        self.line_number = line_number
+        if failed:
+            raise ValueError(
+                f"Invalid character: {c} at line {line_number}, index {i}"
+            )
@@ -0,0 +1,47 @@
+import re
+
+from _gen_lexer import load
+
+
+# The tokenize function generated by `_gen_lexer` for the grammar.
+_tokenize = load()
+
+LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+
+class Lexer:
+    """
+    A simple lexer for tokenizing source code.
+    The tokenizing loop is generated by `_gen_lexer` at import time, with the
+    character classes of the grammar baked in as integer range tests, so no
+    state machine is interpreted while tokenizing.
+    The lexer recognizes the same token types as the DFA based lexers:
+    "NUMBER", "IDENTIFIER", "OPERATOR", "ASSIGN", "IF", "ELSE", "WHILE",
+    "LBRACE", "RBRACE", "LPAREN" and "RPAREN".
+    Attributes:
+        source_code (str): The input source code to be tokenized.
+        tokens (list): A list of tokens generated by the lexer, where each token
+            is a tuple containing the token type, token value, and line number.
+        line_number (int): The current line number being processed.
+        index (int): The current position in the source code being processed.
+    Raises:
+        ValueError: If an invalid character is encountered during tokenization.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Initialize the lexer with the source code to be tokenized.
+        Args:
+            source_code (str): The input source code to be tokenized.
+        """
+        self.source_code = source_code
+        self.tokens = []
+        self.line_number = 1
+        # Start after any leading whitespace instead of storing a stripped copy of the source
+        self.index = LEADING_WHITESPACE_RE.match(source_code).end()
+
+    def tokenize(self):
+        """
+        Tokenize the source code with the generated tokenize function.
+        """
+        self.index, self.line_number = _tokenize(self.source_code, self.tokens, self.index, self.line_number)
@@ -0,0 +1,181 @@
+import re
+
+import numpy as np
+from numba import njit
+
+from lexer_tt import Lexer as TableLexer
+
+
+# The DFA is the one of the table-driven lexer: `lexer_tt.Lexer` already folds
+# the character classes into flat NEXT_STATE/ACTION tables indexed by
+# `state * 256 + byte`, so they are only viewed as uint8 arrays here.
+
+NEXT_STATE = np.frombuffer(TableLexer.NEXT_STATE, dtype=np.uint8)
+ACTION = np.frombuffer(TableLexer.ACTION, dtype=np.uint8)
+
+ADVANCE = TableLexer.ADVANCE
+BEGIN = TableLexer.BEGIN
+NEWLINE_ACTION = TableLexer.NEWLINE_ACTION
+EMIT_SINGLE = TableLexer.EMIT_SINGLE
+EMIT_NUMBER = TableLexer.EMIT_NUMBER
+EMIT_IDENTIFIER = TableLexer.EMIT_IDENTIFIER
+EMIT_OPERATOR = TableLexer.EMIT_OPERATOR
+
+# Token kinds written to the output arrays; identifiers are checked against
+# KEYWORDS once the tokens are converted to tuples.
+NUMBER, IDENTIFIER, OPERATOR, ASSIGN, LBRACE, RBRACE, LPAREN, RPAREN = range(8)
+
+TOKEN_TYPES = ("NUMBER", "IDENTIFIER", "OPERATOR", "ASSIGN", "LBRACE", "RBRACE", "LPAREN", "RPAREN")
+KEYWORDS = {"if": "IF", "else": "ELSE", "while": "WHILE"}
+
+LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+
+@njit(cache=True)
+def _tokenize(buf, next_state_table, action_table, index, line_number):
+    """
+    Runs the DFA over `buf` from `index` and writes one entry per token to the
+    kinds, starts, ends and lines arrays, which are sized for the worst case.
+    Returns the arrays, the token count, the final line number and the index
+    of the invalid character or -1.
+    """
+    n = buf.shape[0]
+    kinds = np.empty(n, np.int32)
+    starts = np.empty(n, np.int32)
+    ends = np.empty(n, np.int32)
+    lines = np.empty(n, np.int32)
+    count = 0
+
+    state = 0
+    i = index
+    start = i
+
+    while i < n:
+        key = state * 256 + buf[i]
+        action = action_table[key]
+        state = next_state_table[key]
+
+        if action == ADVANCE:
+            i += 1
+        elif action == BEGIN:
+            start = i
+            i += 1
+        elif action == NEWLINE_ACTION:
+            line_number += 1
+            i += 1
+        elif action == EMIT_SINGLE:
+            b = buf[i]
+            if b == 123:        # {
+                kinds[count] = LBRACE
+            elif b == 125:      # }
+                kinds[count] = RBRACE
+            elif b == 40:       # (
+                kinds[count] = LPAREN
+            else:               # )
+                kinds[count] = RPAREN
+            starts[count] = i
+            ends[count] = i + 1
+            lines[count] = line_number
+            count += 1
+            i += 1
+        elif action == EMIT_NUMBER or action == EMIT_IDENTIFIER or action == EMIT_OPERATOR:
+            # The byte ending the token is not consumed and is reprocessed in START
+            if action == EMIT_OPERATOR and i - start == 2 and buf[start] == 47 and buf[start + 1] == 47:
+                # "//" comment, skip to the newline ending it
+                while i < n and buf[i] != 10:
+                    i += 1
+                continue
+            if action == EMIT_NUMBER:
+                kinds[count] = NUMBER
+            elif action == EMIT_IDENTIFIER:
+                kinds[count] = IDENTIFIER
+            elif i - start == 1 and buf[start] == 61:
+                kinds[count] = ASSIGN
+            else:
+                kinds[count] = OPERATOR
+            starts[count] = start
+            ends[count] = i
+            lines[count] = line_number
+            count += 1
+        else:
+            return kinds, starts, ends, lines, count, line_number, i
+
+    return kinds, starts, ends, lines, count, line_number, -1
+
+
+class Lexer:
+    """
+    A simple lexer for tokenizing source code, JIT-compiled with Numba.
+    The source is encoded once into a NumPy uint8 buffer and scanned by the
+    `_tokenize` DFA loop compiled with `@njit`, using the flat transition
+    tables of `lexer_tt.Lexer`. The loop only records each token's kind,
+    start, end and line in preallocated int32 arrays; the (type, value, line)
+    tuples are built when `tokens` is accessed.
+    The lexer recognizes the same token types as the DFA based lexers.
+    Attributes:
+        source_code (str): The input source code to be tokenized.
+        tokens (list): A list of tokens generated by the lexer, where each token
+            is a tuple containing the token type, token value, and line number.
+        token_kinds (numpy.ndarray): The kind of each token, indexing `TOKEN_TYPES`.
+        token_starts (numpy.ndarray): The byte offset where each token starts.
+        token_ends (numpy.ndarray): The byte offset where each token ends.
+        token_lines (numpy.ndarray): The line number of each token.
+        line_number (int): The current line number being processed.
+        index (int): The current byte offset in the source code being processed.
+    Raises:
+        ValueError: If an invalid character is encountered during tokenization.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Initialize the lexer with the source code to be tokenized.
+        Args:
+            source_code (str): The input source code to be tokenized.
+        """
+        self.source_code = source_code
+        self.line_number = 1
+        # Start after any leading whitespace; the index is a byte offset into the encoded source
+        start = LEADING_WHITESPACE_RE.match(source_code).end()
+        self.index = len(source_code[:start].encode())
+
+        self._buffer = b""
+        self.token_kinds = self.token_starts = self.token_ends = self.token_lines = np.empty(0, np.int32)
+
+    @property
+    def tokens(self):
+        """
+        The tokens generated so far, as a list of (type, value, line number) tuples.
+        """
+        buffer = self._buffer
+        tokens = []
+        for kind, start, end, line in zip(self.token_kinds.tolist(), self.token_starts.tolist(),
+                                          self.token_ends.tolist(), self.token_lines.tolist()):
+            value = buffer[start:end].decode()
+            if kind == IDENTIFIER:
+                tokens.append((KEYWORDS.get(value, "IDENTIFIER"), value, line))
+            else:
+                tokens.append((TOKEN_TYPES[kind], value, line))
+        return tokens
+
+    def tokenize(self):
+        """
+        Tokenize the source code with the compiled DFA loop.
+        """
+        # A trailing space flushes a token left pending at the end of the input.
+        self._buffer = (self.source_code + " ").encode()
+        buf = np.frombuffer(self._buffer, dtype=np.uint8)
+
+        kinds, starts, ends, lines, count, line_number, error_index = _tokenize(
+            buf, NEXT_STATE, ACTION, self.index, self.line_number
+        )
+        self.token_kinds, self.token_starts = kinds[:count], starts[:count]
+        self.token_ends, self.token_lines = ends[:count], lines[:count]
+        self.line_number = line_number
+
+        if error_index != -1:
+            self.index = error_index
+            char = self._buffer[error_index:error_index + 4].decode(errors="replace")[0]
+            raise ValueError(
+                f"Invalid character: {char} at line {line_number}, index {error_index}"
+            )
+        self.index = len(buf)
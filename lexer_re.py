@@ -0,0 +1,88 @@
+import re
+
+
+# Token patterns, tried in order at each position. Comments must come before
+# operators so that "//" is not read as two divisions, and compound operators
+# before ASSIGN so that "==" is not read as two assignments. MISMATCH catches
+# any other single character so that it can be reported instead of skipped.
+
+TOKEN_RE = re.compile(
+    r"(?P<WHITESPACE>[ \t]+)"
+    r"|(?P<NEWLINE>\n)"
+    r"|(?P<COMMENT>//[^\n]*)"
+    r"|(?P<NUMBER>\d+)"
+    r"|(?P<IDENTIFIER>[A-Za-z_]\w*)"
+    r"|(?P<OPERATOR>[-+*/<>=]=|[-+*/<>])"
+    r"|(?P<ASSIGN>=)"
+    r"|(?P<LBRACE>\{)"
+    r"|(?P<RBRACE>\})"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+    r"|(?P<MISMATCH>.)",
+    re.ASCII,
+)
+
+KEYWORDS = {"if": "IF", "else": "ELSE", "while": "WHILE"}
+
+LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+
+class Lexer:
+    """
+    A simple lexer for tokenizing source code.
+    A single compiled regular expression is used to tokenize the source code.
+    Each alternative of `TOKEN_RE` is a named group and the name of the group
+    that matched is the token type, so the whole scan runs inside the C regex
+    engine and Python only sees one match per token. Identifiers are checked
+    against `KEYWORDS` after they are matched.
+    The lexer recognizes the same token types as the DFA based lexers:
+    "NUMBER", "IDENTIFIER", "OPERATOR", "ASSIGN", "IF", "ELSE", "WHILE",
+    "LBRACE", "RBRACE", "LPAREN" and "RPAREN".
+    Attributes:
+        source_code (str): The input source code to be tokenized.
+        tokens (list): A list of tokens generated by the lexer, where each token
+            is a tuple containing the token type, token value, and line number.
+        line_number (int): The current line number being processed.
+        index (int): The current position in the source code being processed.
+    Raises:
+        ValueError: If an invalid character is encountered during tokenization.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Initialize the lexer with the source code to be tokenized.
+        Args:
+            source_code (str): The input source code to be tokenized.
+        """
+        self.source_code = source_code
+        self.tokens = []
+        self.line_number = 1
+        # Start after any leading whitespace instead of storing a stripped copy of the source
+        self.index = LEADING_WHITESPACE_RE.match(source_code).end()
+
+    def tokenize(self):
+        """
+        Tokenize the source code by iterating over the matches of `TOKEN_RE`.
+        """
+        tokens_append = self.tokens.append
+        line_number = self.line_number
+
+        for match in TOKEN_RE.finditer(self.source_code, self.index):
+            token_type = match.lastgroup
+
+            if token_type == "WHITESPACE" or token_type == "COMMENT":
+                continue
+            elif token_type == "NEWLINE":
+                line_number += 1
+            elif token_type == "IDENTIFIER":
+                token = match.group()
+                tokens_append((KEYWORDS.get(token, "IDENTIFIER"), token, line_number))
+            elif token_type == "MISMATCH":
+                self.line_number, self.index = line_number, match.start()
+                raise ValueError(
+                    f"Invalid character: {match.group()} at line {line_number}, index {self.index}"
+                )
+            else:
+                tokens_append((token_type, match.group(), line_number))
+
+        self.line_number, self.index = line_number, len(self.source_code)
@@ -0,0 +1,33 @@
+from compy_lexer import tokenize as _tokenize
+
+
+class Lexer:
+    """
+    A thin wrapper around the native `compy_lexer` extension.
+    The extension is built from the Rust crate in `compy_lexer/` with
+    `maturin develop --release` and tokenizes the whole source in one call.
+    The lexer recognizes the same token types as the DFA based lexers:
+    "NUMBER", "IDENTIFIER", "OPERATOR", "ASSIGN", "IF", "ELSE", "WHILE",
+    "LBRACE", "RBRACE", "LPAREN" and "RPAREN".
+    Attributes:
+        source_code (str): The input source code to be tokenized.
+        tokens (list): A list of tokens generated by the lexer, where each token
+            is a tuple containing the token type, token value, and line number.
+    Raises:
+        ValueError: If an invalid character is encountered during tokenization.
+    """
+
+    def __init__(self, source_code: str):
+        """
+        Initialize the lexer with the source code to be tokenized.
+        Args:
+            source_code (str): The input source code to be tokenized.
+        """
+        self.source_code = source_code
+        self.tokens = []
+
+    def tokenize(self):
+        """
+        Tokenize the source code with the native extension.
+        """
+        self.tokens = _tokenize(self.source_code)
@@ -1,16 +1,22 @@
 import logging
+import re
 
 
 logger = logging.getLogger(__name__)
 
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
 
 class Lexer:
     """
     A simple lexer for tokenizing source code.
-    A DFA algorithm is used to tokenize the source code.
-    The lexer tokenizes the source code by iterating through each character and
-    applying state transitions based on a transition table. The current state of
-    the lexer is updated based on the character class of the current character.
+    A table-driven DFA algorithm is used to tokenize the source code.
+    The lexer tokenizes the source code by iterating through each byte and
+    applying state transitions based on two flat transition tables indexed by
+    `state * 256 + byte`: `NEXT_STATE` holds the state to move to and `ACTION`
+    holds what to do with the byte. The character class of each byte is folded
+    into the tables when the class is created, so the main loop performs a
+    single indexed lookup per character.
     The lexer recognizes the following token types:
     - "NUMBER": A numeric literal.
     - "IDENTIFIER": An identifier (variable name).
@@ -23,35 +29,29 @@ class Lexer:
     - "RBRACE": The right brace character "}".
     - "LPAREN": The left parenthesis character "(".
     - "RPAREN": The right parenthesis character ")".
-    The lexer logs detailed debug information about the current state, character,
-    token, character class, next state, action, and the updated token during the
-    tokenization process.
     Attributes:
         source_code (str): The input source code to be tokenized.
         tokens (list): A list of tokens generated by the lexer, where each token
             is a tuple containing the token type, token value, and line number.
         line_number (int): The current line number being processed.
-        current_token (str): The token being constructed.
-        state (str): The current state of the state machine.
-        index (int): The current position in the source code being processed.
-        transition_table (dict): A dictionary representing the state transition
-            table, mapping (state, char_class) pairs to (next_state, action)
-            tuples.
+        state (int): The current state of the state machine.
+        index (int): The current byte offset in the source code being processed.
+        NEXT_STATE (bytes): The flat next-state table, indexed by
+            `state * 256 + byte`.
+        ACTION (bytes): The flat action table, indexed like `NEXT_STATE`.
     Raises:
         ValueError: If an invalid character is encountered during tokenization.
 """
 
-    logging.basicConfig(level=logging.INFO)
-
-
     # Define the states of the lexer as constants.
+    # States are small integers so they can be used to index the flat tables.
+
+    START = 0
+    IN_NUMBER = 1
+    IN_IDENTIFIER = 2
+    IN_OPERATOR = 3
 
-    START = "START"
-    IN_NUMBER = "IN_NUMBER"
-    IN_IDENTIFIER = "IN_IDENTIFIER"
-    IN_OPERATOR = "IN_OPERATOR"
-    IN_COMMENT = "IN_COMMENT"
-    IN_ERROR = "IN_ERROR"
+    STATE_COUNT = 4
 
 
     # Define character classes using bit flags and a lookup table.
@@ -82,7 +82,7 @@ class Lexer:
     for op in "+-*/<>=":
         char_classes[ord(op)] = OPERATOR
 
-    for ws in " \t": 
+    for ws in " \t":
         char_classes[ord(ws)] = WHITESPACE
 
     char_classes[ord("\n")] = NEWLINE
@@ -91,175 +91,177 @@ class Lexer:
         char_classes[ord(sc)] = SINGLE_CHAR
 
 
+    # Define the actions the lexer can take on a byte.
+    # Tokens are not accumulated character by character: BEGIN records where
+    # the token starts and scans the token body in an inner loop over the row
+    # of the token state, until it reaches one of the EMIT_* actions, which
+    # slices the token out of the source. The byte that ends the token is not
+    # consumed; the main loop picks it up directly in the START state, so no
+    # iteration of the main loop is spent only on emitting the token.
+
+    ADVANCE         = 0     # consume the byte (whitespace or token body)
+    BEGIN           = 1     # mark the start of a token and consume the byte
+    NEWLINE_ACTION  = 2     # consume the byte and increment the line number
+    EMIT_SINGLE     = 3     # emit a single-character token
+    EMIT_NUMBER     = 4     # end of a number token
+    EMIT_IDENTIFIER = 5     # end of an identifier or keyword token
+    EMIT_OPERATOR   = 6     # end of an operator token or start of a comment
+    ERROR           = 7     # raise an error for an invalid character
+
+    transitions = {
+        START: {
+            DIGIT: (IN_NUMBER, BEGIN),
+            ALPHA: (IN_IDENTIFIER, BEGIN),
+            OPERATOR: (IN_OPERATOR, BEGIN),
+            WHITESPACE: (START, ADVANCE),
+            NEWLINE: (START, NEWLINE_ACTION),
+            SINGLE_CHAR: (START, EMIT_SINGLE),
+        },
+        IN_NUMBER: {
+            DIGIT: (IN_NUMBER, ADVANCE),
+            ALPHA: (START, EMIT_NUMBER),
+            OPERATOR: (START, EMIT_NUMBER),
+            WHITESPACE: (START, EMIT_NUMBER),
+            NEWLINE: (START, EMIT_NUMBER),
+            SINGLE_CHAR: (START, EMIT_NUMBER),
+        },
+        IN_IDENTIFIER: {
+            DIGIT: (IN_IDENTIFIER, ADVANCE),
+            ALPHA: (IN_IDENTIFIER, ADVANCE),
+            OPERATOR: (START, EMIT_IDENTIFIER),
+            WHITESPACE: (START, EMIT_IDENTIFIER),
+            NEWLINE: (START, EMIT_IDENTIFIER),
+            SINGLE_CHAR: (START, EMIT_IDENTIFIER),
+        },
+        IN_OPERATOR: {
+            DIGIT: (START, EMIT_OPERATOR),
+            ALPHA: (START, EMIT_OPERATOR),
+            OPERATOR: (IN_OPERATOR, ADVANCE),
+            WHITESPACE: (START, EMIT_OPERATOR),
+            NEWLINE: (START, EMIT_OPERATOR),
+            SINGLE_CHAR: (START, EMIT_OPERATOR),
+        },
+    }
+
+    # Flatten the transitions into the NEXT_STATE and ACTION tables.
+    # Any (state, class) pair missing from the transitions is an error.
+
+    NEXT_STATE = bytearray(STATE_COUNT * 256)
+    ACTION = bytearray([ERROR]) * (STATE_COUNT * 256)
+
+    for state, row in transitions.items():
+        for byte in range(256):
+            if char_classes[byte] in row:
+                NEXT_STATE[state * 256 + byte], ACTION[state * 256 + byte] = row[char_classes[byte]]
+
+    NEXT_STATE = bytes(NEXT_STATE)
+    ACTION = bytes(ACTION)
+
+    del i, op, ws, sc, state, row, byte
+
+    token_map = {
+        ord("{"): "LBRACE",
+        ord("}"): "RBRACE",
+        ord("("): "LPAREN",
+        ord(")"): "RPAREN",
+    }
+
+    keywords = {
+        "if": "IF",
+        "else": "ELSE",
+        "while": "WHILE",
+    }
+
+
     def __init__(self, source_code: str):
         """
         Initialize the lexer with the source code to be tokenized.
         Args:
             source_code (str): The input source code to be tokenized.
         """
-        self.source_code = source_code.lstrip()
+        self.source_code = source_code
         self.tokens = []
         self.line_number = 1
-        self.current_token = ""
         self.state = self.START
-        self.index = 0
-
-        self.transition_table = {
-            self.START: {
-                self.DIGIT: (self.IN_NUMBER, self._add_to_token),
-                self.ALPHA: (self.IN_IDENTIFIER, self._add_to_token),
-                self.OPERATOR: (self.IN_OPERATOR, self._add_to_token),
-                self.WHITESPACE: (self.START, self._ignore_char),
-                self.NEWLINE: (self.START, self._increment_line),
-                self.SINGLE_CHAR: (self.START, self._emit_single_character_token),
-                self.UNKOWN: (self.START, self._raise_error),
-            },
-            self.IN_NUMBER: {
-                self.DIGIT: (self.IN_NUMBER, self._add_to_token),
-                self.WHITESPACE: (self.START, self._emit_number_token),
-                self.NEWLINE: (self.START, self._emit_number_token),
-                self.UNKOWN: (self.START, self._raise_error),
-            },
-            self.IN_IDENTIFIER: {
-                self.ALPHA: (self.IN_IDENTIFIER, self._add_to_token),
-                self.WHITESPACE: (self.START, self._handle_identifier_token),
-                self.NEWLINE: (self.START, self._raise_error),
-                self.UNKOWN: (self.START, self._raise_error),
-            },
-            self.IN_OPERATOR: {
-                self.OPERATOR: (self.IN_OPERATOR, self._add_to_token),
-                self.WHITESPACE: (self.START, self._handle_operator_token),
-                self.NEWLINE: (self.START, self._handle_operator_token),
-                self.UNKOWN: (self.START, self._raise_error),
-            },
-        }
+        # Start after any leading whitespace instead of storing a stripped copy
+        # of the source; the index is a byte offset into the encoded source.
+        start = _LEADING_WHITESPACE_RE.match(source_code).end()
+        self.index = len(source_code[:start].encode())
 
     def tokenize(self):
         """
-        Tokenize the source code by iterating through each character and applying
-        state transitions based on the transition table.
-        """
-
-        while self.index < len(self.source_code):
-            next_char = self.source_code[self.index]
-            char_class = self._get_char_class(next_char)
-
-            logger.debug(f"State: {self.state}, Char: {next_char}, Token: {self.current_token}, Char class: {char_class}")
-            self.state, action = self.transition_table[self.state][char_class]
-            logger.debug(f"Next state: {self.state}, Action: {action.__name__}")
-            self.current_token = action(next_char, self.current_token)
-            logger.debug(f"Current token: |{self.current_token}|")
-            self.index += 1
-
-    def _get_char_class(self, char: str):
+        Tokenize the source code by iterating through each byte and applying
+        state transitions based on the flat transition tables. The body of a
+        number, identifier or operator is scanned by an inner loop, so the main
+        loop only ever runs in the START state.
         """
-        Get the character class for the given character.
-        Args:
-            char (str): The character to classify.
-        Returns:
-            int: The character class as a bit flag.
-        """
-        char_class = self.char_classes[ord(char)]
-        if char_class & self.DIGIT:
-            return self.DIGIT
-        elif char_class & self.ALPHA:
-            return self.ALPHA
-        elif char_class & self.OPERATOR:
-            return  self.OPERATOR
-        elif char_class & self.WHITESPACE:
-            return self.WHITESPACE
-        elif char_class & self.NEWLINE:
-            return self.NEWLINE
-        elif char_class & self.SINGLE_CHAR:
-            return self.SINGLE_CHAR
-        else:
-            return self.UNKOWN
-
-    # Following method are a series of actions that the lexer can take
-    # based on the current state and the character being processed.
-
-    def _add_to_token(self, char: str, token: str):
-        return token + char
-
-    def _ignore_char(self, char: str, token: str):
-        return ""
-
-    def _increment_line(self, char: str, token: str):
-        self.line_number += 1
-        return ""
-
-    def _emit_single_character_token(self, char: str, token: str):
-        token_map = {
-            "{": "LBRACE",
-            "}": "RBRACE",
-            "(": "LPAREN",
-            ")": "RPAREN",
-            "=": "ASSIGN",
-        }
-        self._emit_token(token_type=token_map[char], token=char)
-        return ""
-
-    def _emit_number_token(self, char: str, token: str):
-        self._emit_token(token_type="NUMBER", token=token)
-        if char == "\n":
-            self.line_number += 1
-        return ""
-
-    def _handle_identifier_token(self, char: str, token: str):
-        if token in ["if", "else", "while"]:
-            return self._emit_keyword_token(char, token)
-        return self._emit_identifier_token(char, token)
-
-    def _emit_keyword_token(self, char: str, token: str):
-        self._emit_token(token_type=token.upper(), token=token)
-        if char == "\n":
-            self.line_number += 1
-        return ""
-
-    def _emit_identifier_token(self, char: str, token: str):
-        self._emit_token(token_type="IDENTIFIER", token=token)
-        if char == "\n":
-            self.line_number += 1
-        return ""
-
-    def _handle_operator_token(self, char: str, token: str):
-        if token in ["==", "<=", ">=", "!="]:
-            token = self._emit_operator_token(token)
-        elif token in ["+=", "-=", "*=", "/="]:
-            token = self._emit_operator_token(token)
-        elif token in ["++", "--", "**"]:
-            token = self._emit_operator_token(token)
-        elif token == "=":
-            token = self._emit_assign_token(token)
-        elif token == "//":
-            token = self._handle_comment()
-        else:
-            token = self._emit_operator_token(token)
-        return token
-
-    def _emit_operator_token(self, token: str):
-        self._emit_token(token_type="OPERATOR", token=token)
-        return ""
-    
-
-    def _emit_assign_token(self, token: str):
-        self._emit_token(token_type="ASSIGN", token=token)
-        return ""
-
-    def _emit_token(self, token_type: str, token: str):
-        self.tokens.append((token_type, token, self.line_number))
-
-    def _raise_error(self, char: str, token: str):
+        # A trailing space flushes a token left pending at the end of the input.
+        src = (self.source_code + " ").encode()
+        n = len(src)
+        next_state_table = self.NEXT_STATE
+        action_table = self.ACTION
+        token_map = self.token_map
+        keywords = self.keywords
+        tokens_append = self.tokens.append
+        START = self.START
+        ADVANCE, BEGIN, NEWLINE_ACTION = self.ADVANCE, self.BEGIN, self.NEWLINE_ACTION
+        EMIT_SINGLE, EMIT_NUMBER = self.EMIT_SINGLE, self.EMIT_NUMBER
+        EMIT_IDENTIFIER, EMIT_OPERATOR = self.EMIT_IDENTIFIER, self.EMIT_OPERATOR
+
+        state = self.state
+        line_number = self.line_number
+        i = self.index
+        start = i
+
+        while i < n:
+            key = state * 256 + src[i]
+            action = action_table[key]
+            state = next_state_table[key]
+
+            if action == ADVANCE:
+                i += 1
+            elif action == BEGIN:
+                # Scan the token body in its own row of the tables; the
+                # trailing space guarantees the scan stops before the end.
+                start = i
+                i += 1
+                row = state * 256
+                action = action_table[row + src[i]]
+                while action == ADVANCE:
+                    i += 1
+                    action = action_table[row + src[i]]
+
+                if action == EMIT_NUMBER:
+                    tokens_append(("NUMBER", src[start:i].decode(), line_number))
+                elif action == EMIT_IDENTIFIER:
+                    token = src[start:i].decode()
+                    tokens_append((keywords.get(token, "IDENTIFIER"), token, line_number))
+                elif action == EMIT_OPERATOR:
+                    token = src[start:i].decode()
+                    if token == "//":
+                        comment_end = src.find(b"\n", i)
+                        i = n if comment_end == -1 else comment_end
+                    elif token == "=":
+                        tokens_append(("ASSIGN", token, line_number))
+                    else:
+                        tokens_append(("OPERATOR", token, line_number))
+                else:
+                    self.state, self.line_number, self.index = state, line_number, i
+                    self._raise_error(src[i:i + 4].decode(errors="replace")[0])
+                state = START
+            elif action == NEWLINE_ACTION:
+                line_number += 1
+                i += 1
+            elif action == EMIT_SINGLE:
+                tokens_append((token_map[src[i]], chr(src[i]), line_number))
+                i += 1
+            else:
+                self.state, self.line_number, self.index = state, line_number, i
+                self._raise_error(src[i:i + 4].decode(errors="replace")[0])
+
+        self.state, self.line_number, self.index = state, line_number, i
+
+    def _raise_error(self, char: str):
         raise ValueError(
             f"Invalid character: {char} at line {self.line_number}, index {self.index}"
         )
-
-    def _handle_comment(self):
-        comment_end = self.source_code.find("\n", self.index)
-        if comment_end == -1:
-            self.index = len(self.source_code)
-        else:
-            self.index = comment_end
-        self.line_number += 1
-        self.state = self.START
-        return ""
\ No newline at end of file
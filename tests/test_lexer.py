@@ -2,6 +2,23 @@ import unittest
 
 from lexer import Lexer as LexerBasic
 from lexer_tt import Lexer as LexerTT
+from lexer_re import Lexer as LexerRE
+from lexer_gen import Lexer as LexerGen
+
+try:
+    from lexer_cy import Lexer as LexerCY
+except ImportError:
+    LexerCY = None
+
+try:
+    from lexer_rs import Lexer as LexerRS
+except ImportError:
+    LexerRS = None
+
+try:
+    from lexer_nb import Lexer as LexerNB
+except ImportError:
+    LexerNB = None
 
 class TestLexer(unittest.TestCase):
     def test_lexer(self):
@@ -45,8 +62,89 @@ class TestLexer(unittest.TestCase):
         lexer.tokenize()
         tokens = lexer.tokens
         self.assertEqual(tokens, expected)
+        self.assertEqual(list(LexerBasic(source_code=source_code)), expected)
 
         lexer_tt = LexerTT(source_code=source_code)
         lexer_tt.tokenize()
         tokens_tt = lexer_tt.tokens
-        self.assertEqual(tokens_tt, expected)
\ No newline at end of file
+        self.assertEqual(tokens_tt, expected)
+
+        lexer_re = LexerRE(source_code=source_code)
+        lexer_re.tokenize()
+        tokens_re = lexer_re.tokens
+        self.assertEqual(tokens_re, expected)
+
+        lexer_gen = LexerGen(source_code=source_code)
+        lexer_gen.tokenize()
+        tokens_gen = lexer_gen.tokens
+        self.assertEqual(tokens_gen, expected)
+
+        if LexerCY is not None:
+            lexer_cy = LexerCY(source_code=source_code)
+            lexer_cy.tokenize()
+            tokens_cy = lexer_cy.tokens
+            self.assertEqual(tokens_cy, expected)
+
+        if LexerRS is not None:
+            lexer_rs = LexerRS(source_code=source_code)
+            lexer_rs.tokenize()
+            tokens_rs = lexer_rs.tokens
+            self.assertEqual(tokens_rs, expected)
+
+        if LexerNB is not None:
+            lexer_nb = LexerNB(source_code=source_code)
+            lexer_nb.tokenize()
+            tokens_nb = lexer_nb.tokens
+            self.assertEqual(tokens_nb, expected)
+
+    def test_token_boundaries(self):
+
+        source_code = "if (x1==10) {y=x1-2} // trailing comment\nz"
+
+        expected = [
+            ('IF', 'if', 1),
+            ('LPAREN', '(', 1),
+            ('IDENTIFIER', 'x1', 1),
+            ('OPERATOR', '==', 1),
+            ('NUMBER', '10', 1),
+            ('RPAREN', ')', 1),
+            ('LBRACE', '{', 1),
+            ('IDENTIFIER', 'y', 1),
+            ('ASSIGN', '=', 1),
+            ('IDENTIFIER', 'x1', 1),
+            ('OPERATOR', '-', 1),
+            ('NUMBER', '2', 1),
+            ('RBRACE', '}', 1),
+            ('IDENTIFIER', 'z', 2)
+        ]
+
+        lexer = LexerBasic(source_code=source_code)
+        lexer.tokenize()
+        self.assertEqual(lexer.tokens, expected)
+
+        lexer_tt = LexerTT(source_code=source_code)
+        lexer_tt.tokenize()
+        self.assertEqual(lexer_tt.tokens, expected)
+
+        lexer_re = LexerRE(source_code=source_code)
+        lexer_re.tokenize()
+        self.assertEqual(lexer_re.tokens, expected)
+
+        lexer_gen = LexerGen(source_code=source_code)
+        lexer_gen.tokenize()
+        self.assertEqual(lexer_gen.tokens, expected)
+
+        if LexerCY is not None:
+            lexer_cy = LexerCY(source_code=source_code)
+            lexer_cy.tokenize()
+            self.assertEqual(lexer_cy.tokens, expected)
+
+        if LexerRS is not None:
+            lexer_rs = LexerRS(source_code=source_code)
+            lexer_rs.tokenize()
+            self.assertEqual(lexer_rs.tokens, expected)
+
+        if LexerNB is not None:
+            lexer_nb = LexerNB(source_code=source_code)
+            lexer_nb.tokenize()
+            self.assertEqual(lexer_nb.tokens, expected)